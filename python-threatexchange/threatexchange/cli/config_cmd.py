@@ -6,12 +6,16 @@ Config command to setup the CLI and settings.
 
 import argparse
 import collections.abc
+import concurrent.futures
+import functools
 from dataclasses import is_dataclass, Field, fields, MISSING
 from enum import Enum
 import itertools
 import json
 import logging
+import operator
 import os
+import sys
 import typing as t
 
 from threatexchange.exchanges.clients.fb_threatexchange.api import ThreatExchangeAPI
@@ -27,10 +31,11 @@ from threatexchange.exchanges.impl.fb_threatexchange_api import (
 )
 from threatexchange.exchanges.signal_exchange_api import SignalExchangeAPI
 from threatexchange.exchanges.impl.ncmec_api import NCMECSignalExchangeAPI
-from threatexchange.exchanges.impl.static_sample import StaticSampleSignalExchangeAPI
 from threatexchange.exchanges.impl.techagainstterrorism_api import TATSignalExchangeAPI
 from threatexchange.utils import dataclass_json
 
+_NL_TO_SPACE = str.maketrans({"\n": " ", "\r": " "})
+
 
 class ConfigCollabListCommand(command_base.Command):
     """List collaborations"""
@@ -46,8 +51,8 @@ class ConfigCollabListCommand(command_base.Command):
         pass
 
     def execute(self, settings: CLISettings) -> None:
-        for collab in settings.get_all_collabs(default_to_sample=False):
-            print(collab.api, collab.name)
+        collabs = settings.get_all_collabs(default_to_sample=False)
+        sys.stdout.write("".join(f"{c.api} {c.name}\n" for c in collabs))
 
 
 class ConfigCollabPrintCommand(command_base.Command):
@@ -98,31 +103,54 @@ class _UpdateCollabCommand(command_base.Command):
 
     Programatically generated by inspecting the config class, so not everything will be
     documented.
+
+    For scripted edits, arguments can also be read from a file, one per line:
+
+    ```
+    $ threatexchange config collab edit ncmec @my_args.txt
+    ```
     """
 
     _API_CLS: t.ClassVar[t.Type[SignalExchangeAPI]]
 
-    _IGNORE_FIELDS = {
-        "name",
-        "api",
-        "enabled",
-        # "only_signal_types",
-        # "not_signal_types",
-        # "only_owners",
-        # "not_owners",
-        # "only_tags",
-        # "not_tags",
-    }
+    _IGNORE_FIELDS = frozenset(
+        {
+            "name",
+            "api",
+            "enabled",
+            # "only_signal_types",
+            # "not_signal_types",
+            # "only_owners",
+            # "not_owners",
+            # "only_tags",
+            # "not_tags",
+        }
+    )
 
     @classmethod
     def get_name(cls) -> str:
         return cls._API_CLS.get_name()
 
     @classmethod
-    def init_argparse(cls, settings: CLISettings, ap: argparse.ArgumentParser) -> None:
+    @functools.lru_cache(maxsize=None)
+    def _classified_fields(cls) -> t.Tuple[t.Tuple[Field, ...], t.FrozenSet[str]]:
+        """
+        Split the config fields into (argument fields, names of non-init fields)
+
+        Cached per generated subclass, since the config class never changes.
+        """
         cfg_cls = cls._API_CLS.get_config_cls()
         assert is_dataclass(cfg_cls)
+        cfg_fields = fields(cfg_cls)
+        return (
+            tuple(f for f in cfg_fields if cls._is_argument_field(f)),
+            frozenset(f.name for f in cfg_fields if not f.init),
+        )
 
+    @classmethod
+    def init_argparse(cls, settings: CLISettings, ap: argparse.ArgumentParser) -> None:
+        # Only enabled here, since other commands take content that may start with @
+        ap.fromfile_prefix_chars = "@"
         ap.add_argument("collab_name", help="the name of the collab")
         ap.set_defaults(api_name=cls._API_CLS.get_name())
         ap.add_argument(
@@ -152,7 +180,7 @@ class _UpdateCollabCommand(command_base.Command):
             help="disable the config",
         )
 
-        type_specific_fields = [f for f in fields(cfg_cls) if cls._is_argument_field(f)]
+        type_specific_fields, _ = cls._classified_fields()
         if type_specific_fields:
             config_ap = ap.add_argument_group(
                 description=f"specific to {cls._API_CLS.get_name()}"
@@ -179,21 +207,22 @@ class _UpdateCollabCommand(command_base.Command):
     @classmethod
     def _add_argument(cls, ap: argparse._ArgumentGroup, field: Field) -> None:
         assert cls._is_argument_field(field)
+        target_type = field.type
         assert not isinstance(
-            field.type, t.ForwardRef
+            target_type, t.ForwardRef
         ), "rework class to not have forward ref"
 
-        origin = t.get_origin(field.type)
-        argparse_type: t.Callable[[str], t.Any] = field.type
+        origin = t.get_origin(target_type)
+        argparse_type: t.Callable[[str], t.Any] = target_type
         metavar: str
-        if isinstance(field.type, type) and issubclass(field.type, Enum):
+        if isinstance(target_type, type) and issubclass(target_type, Enum):
             argparse_type = common.argparse_choices_pre_type(
-                [m.name for m in field.type],
-                lambda s: field.type[s],
+                [m.name for m in target_type],
+                lambda s: target_type[s],
             )
-            metavar = f"[{','.join(m.name for m in field.type)}]"
+            metavar = f"[{','.join(m.name for m in target_type)}]"
         elif origin is not None:
-            arg_type = t.get_args(field.type)[0]
+            arg_type = t.get_args(target_type)[0]
             if isinstance(origin, type) and issubclass(
                 origin, collections.abc.Collection
             ):
@@ -204,10 +233,10 @@ class _UpdateCollabCommand(command_base.Command):
                 metavar = arg_type.__name__
             else:
                 raise AssertionError(
-                    f"Unhandled complex type for {field.name}: {field.type}"
+                    f"Unhandled complex type for {field.name}: {target_type}"
                 )
         else:
-            metavar = field.type.__name__
+            metavar = target_type.__name__
 
         help = "[missing] Add a help annotation on the config class!"
         if field.metadata:
@@ -247,14 +276,12 @@ class _UpdateCollabCommand(command_base.Command):
         if enable is not None:
             self.edit_kwargs["enabled"] = bool(enable)
 
-        for field in fields(self._API_CLS.get_config_cls()):
-            if not field.init:
-                if field.name == "api":
-                    self.edit_kwargs.pop("api", None)
-                continue
-            if field.name in self._IGNORE_FIELDS:
-                continue
-            val = getattr(full_argparse_namespace, field.name)
+        argument_fields, non_init_names = self._classified_fields()
+        if "api" in non_init_names:
+            self.edit_kwargs.pop("api", None)
+        ns_dict = vars(full_argparse_namespace)
+        for field in argument_fields:
+            val = ns_dict.get(field.name)
             if val is not None:
                 self.edit_kwargs[field.name] = val
 
@@ -295,16 +322,19 @@ class ConfigCollabForAPICommand(command_base.CommandWithSubcommands):
     @classmethod
     def init_argparse(cls, settings: CLISettings, ap: argparse.ArgumentParser) -> None:
         cls._SUBCOMMANDS = [
-            cls._create_command_for_api(api)
-            for api in settings.apis
-            if api.__class__ is not StaticSampleSignalExchangeAPI
+            cls._create_command_for_api(api) for api in settings.apis.get_all()
         ]
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def _create_command_for_api(
         cls, api: t.Type[SignalExchangeAPI]
     ) -> t.Type[command_base.Command]:
-        """Don't try this at home!"""
+        """
+        Don't try this at home!
+
+        Cached, so that each API only ever gets one generated class per process.
+        """
 
         class _GeneratedUpdateCommand(_UpdateCollabCommand):
             _API_CLS = api
@@ -423,19 +453,11 @@ class ConfigExtensionsCommand(command_base.Command):
             raise ValueError(f"Manifest failed verification: {self.module}") from exc
 
         # Validate our new setups by pretending to create a new mapping with the new classes
-        content_and_settings = interface_validation.SignalTypeMapping(
-            list(
-                itertools.chain(
-                    settings.get_all_content_types(), manifest.content_types
-                )
-            ),
-            list(
-                itertools.chain(settings.get_all_signal_types(), manifest.signal_types)
-            ),
-        )
+        all_content = [*settings.get_all_content_types(), *manifest.content_types]
+        all_signal = [*settings.get_all_signal_types(), *manifest.signal_types]
+        interface_validation.SignalTypeMapping(all_content, all_signal)
 
-        apis = list(manifest.apis)
-        apis.extend(settings.apis.get_all())
+        apis = [*manifest.apis, *settings.apis.get_all()]
         interface_validation.SignalExchangeAPIMapping(apis)
 
         self.execute_list(settings)
@@ -458,23 +480,21 @@ class ConfigExtensionsCommand(command_base.Command):
     ) -> None:
         space = " " * indent
         level2 = f"\n{space}  "
-        if manifest.signal_types:
+        # str.join() builds a list from a generator anyway, so build it directly
+        sig_lines = [f"{s.get_name()} - {s.__name__}" for s in manifest.signal_types]
+        content_lines = [
+            f"{c.get_name()} - {c.__name__}" for c in manifest.content_types
+        ]
+        api_lines = [f"{a.get_name()} - {a.__name__}" for a in manifest.apis]
+        if sig_lines:
             print(f"{space}Signal:{level2}", end="")
-            print(
-                level2.join(
-                    f"{s.get_name()} - {s.__name__}" for s in manifest.signal_types
-                )
-            )
-        if manifest.content_types:
+            print(level2.join(sig_lines))
+        if content_lines:
             print(f"{space}Content:{level2}", end="")
-            print(
-                level2.join(
-                    f"{c.get_name()} - {c.__name__}" for c in manifest.content_types
-                )
-            )
-        if manifest.apis:
+            print(level2.join(content_lines))
+        if api_lines:
             print(f"{space}Content:{level2}", end="")
-            print(level2.join(f"{a.get_name()} - {a.__name__}" for a in manifest.apis))
+            print(level2.join(api_lines))
 
 
 class ConfigSignalCommand(command_base.Command):
@@ -504,10 +524,8 @@ class ConfigSignalCommand(command_base.Command):
 
     def execute_list(self, settings: CLISettings) -> None:
         signals = settings.get_all_signal_types()
-        for name, class_name in sorted(
-            (st.get_name(), _fully_qualified_name(st)) for st in signals
-        ):
-            print(name, class_name)
+        rows = sorted((st.get_name(), _fully_qualified_name(st)) for st in signals)
+        sys.stdout.write("".join(f"{name} {class_name}\n" for name, class_name in rows))
 
 
 class ConfigContentCommand(command_base.Command):
@@ -537,10 +555,8 @@ class ConfigContentCommand(command_base.Command):
 
     def execute_list(self, settings: CLISettings) -> None:
         content_types = settings.get_all_content_types()
-        for name, class_name in sorted(
-            (c.get_name(), _fully_qualified_name(c)) for c in content_types
-        ):
-            print(name, class_name)
+        rows = sorted((c.get_name(), _fully_qualified_name(c)) for c in content_types)
+        sys.stdout.write("".join(f"{name} {class_name}\n" for name, class_name in rows))
 
 
 class ConfigThreatExchangeAPICommand(command_base.Command):
@@ -596,22 +612,30 @@ class ConfigThreatExchangeAPICommand(command_base.Command):
     def execute_list_collabs(self, settings: CLISettings) -> None:
         api = self.get_te_api()
 
-        unique_privacy_groups = {
-            pg.id: pg for pg in api.get_threat_privacy_groups_member()
-        }
-        unique_privacy_groups.update(
-            (pg.id, pg) for pg in api.get_threat_privacy_groups_owner()
-        )
+        # Two independent network calls, so overlap them
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            member_fut = executor.submit(api.get_threat_privacy_groups_member)
+            owner_fut = executor.submit(api.get_threat_privacy_groups_owner)
+            unique_privacy_groups = {
+                pg.id: pg
+                for pg in itertools.chain(member_fut.result(), owner_fut.result())
+            }
 
         max_width = os.get_terminal_size().columns
 
-        for pg in sorted(unique_privacy_groups.values(), key=lambda pg: pg.name):
-            if not pg.threat_updates_enabled:
-                continue
-            line = f"{pg.id} {pg.name} - {pg.description}".replace("\n", " ")
+        enabled_groups = [
+            pg for pg in unique_privacy_groups.values() if pg.threat_updates_enabled
+        ]
+        enabled_groups.sort(key=operator.attrgetter("name"))
+
+        trunc_at = max_width - 3
+        lines = []
+        for pg in enabled_groups:
+            line = f"{pg.id} {pg.name} - {pg.description}".translate(_NL_TO_SPACE)
             if len(line) > max_width:
-                line = f"{line[:max_width-3]}..."
-            print(line)
+                line = line[:trunc_at] + "..."
+            lines.append(f"{line}\n")
+        sys.stdout.write("".join(lines))
 
     def execute_import(self, settings: CLISettings, privacy_group_id: int) -> None:
         api = self.get_te_api()
@@ -700,8 +724,9 @@ class ConfigAPICommand(command_base.CommandWithSubcommands):
 
     def execute(self, settings: CLISettings) -> None:
         apis = settings.apis.get_all()
-        for name in sorted(a.get_name() for a in apis):
-            print(name)
+        sys.stdout.write(
+            "".join(f"{name}\n" for name in sorted(a.get_name() for a in apis))
+        )
 
 
 class ConfigCommand(command_base.CommandWithSubcommands):
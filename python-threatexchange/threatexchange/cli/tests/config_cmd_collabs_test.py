@@ -1,5 +1,6 @@
 # Copyright (c) Meta Platforms, Inc. and affiliates.
 
+import pathlib
 import pytest
 from threatexchange.cli.tests.e2e_test_helper import (
     ThreatExchangeCLIE2eHelper,
@@ -57,6 +58,25 @@ def test_editing_collab(cli: ThreatExchangeCLIE2eHelper) -> None:
     )
 
 
+def test_edit_sample(cli: ThreatExchangeCLIE2eHelper) -> None:
+    # Lets you keep the sample collab alongside real ones
+    name = "my_sample"
+    cli.cli_call("edit", "sample", "-C", name)
+    cli.assert_cli_output(("list",), expected_output=f"sample {name}")
+
+
+def test_args_from_file(
+    cli: ThreatExchangeCLIE2eHelper, tmp_path: pathlib.Path
+) -> None:
+    name = "from_file"
+    args_file = tmp_path / "args.txt"
+    args_file.write_text(
+        f"-C\n{name}\n--environment={NCMECEnvironment.test_NGO.name}\n"
+    )
+    cli.cli_call("edit", "ncmec", f"@{args_file}")
+    cli.assert_cli_output(("list",), expected_output=f"ncmec {name}")
+
+
 def test_complex_types(cli: ThreatExchangeCLIE2eHelper) -> None:
     cli.cli_call(
         "tx",